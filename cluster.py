@@ -18,6 +18,7 @@ about loneliness, crypto, home security, or AI tutoring.
 
 import re
 from collections import defaultdict
+from statistics import fmean
 
 # Words too common to cluster on
 STOP_WORDS = {
@@ -149,8 +150,8 @@ def _build_cluster(scored_trends: list[dict], indices: list[int],
                    name: str | None = None) -> dict:
     """Build a cluster record from member indices."""
     members = [scored_trends[i] for i in indices]
-    scores = [m["score"] for m in members]
-    avg = sum(scores) / len(scores)
+    # fmean over a generator — no intermediate score list per cluster
+    avg = fmean(m["score"] for m in members)
     top = max(members, key=lambda m: m["score"])
 
     # Auto-name from most frequent tokens if no name given
@@ -23,10 +23,10 @@ GREEN/YELLOW/RED signal remains precise regardless of full-web results.
 import json
 import os
 import time
-import urllib.request
-import urllib.error
 from pathlib import Path
+from urllib.parse import quote
 
+import requests
 from dotenv import load_dotenv
 
 load_dotenv(Path(__file__).parent / ".env")
@@ -34,6 +34,14 @@ load_dotenv(Path(__file__).parent / ".env")
 _BRAVE_KEY = os.getenv("BRAVE_SEARCH_KEY", "")
 _REQUEST_DELAY = 1.2  # Brave free tier: 1 req/sec
 
+# Shared session — both passes can issue a dozen Brave queries back to
+# back, so connection reuse skips a TLS handshake per query.
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    "X-Subscription-Token": _BRAVE_KEY,
+    "Accept": "application/json",
+})
+
 # Domains that are unambiguous evidence of an existing purpose-built tool.
 # Only results from these domains count toward competitor score.
 _TOOL_DOMAINS = {
@@ -141,20 +149,17 @@ def _search_brave(query: str, count: int = 10) -> list[dict]:
     if not _BRAVE_KEY:
         return []
 
-    encoded_q = urllib.request.quote(query, safe='')
+    encoded_q = quote(query, safe='')
     url = (
         f"https://api.search.brave.com/res/v1/web/search"
         f"?q={encoded_q}&count={count}&search_lang=en"
     )
 
     try:
-        req = urllib.request.Request(
-            url,
-            headers={"X-Subscription-Token": _BRAVE_KEY, "Accept": "application/json"},
-        )
-        with urllib.request.urlopen(req, timeout=15) as resp:
-            data = json.loads(resp.read().decode("utf-8"))
-    except (urllib.error.HTTPError, urllib.error.URLError, TimeoutError) as e:
+        resp = _SESSION.get(url, timeout=15)
+        resp.raise_for_status()
+        data = resp.json()
+    except (requests.RequestException, json.JSONDecodeError) as e:
         print(f"[competitor] Brave search failed for '{query}': {e}")
         return []
 
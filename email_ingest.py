@@ -22,12 +22,22 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+# Applied to every IMAP socket operation (connect, search, fetch). Well
+# under pipeline.SOURCE_TIMEOUT so a dead connection fails here first.
+_IMAP_TIMEOUT = 30
+
 # Sections to skip — entertainment/calendar noise
 _SKIP_SECTIONS = {"mark your calendars", "notes"}
 
 # Patterns to extract quoted keywords and growth signals
 _QUOTE_RE = re.compile(r'[\u201c"]\s*([^"\u201d]{3,60}?)\s*[\u201d"]')
 
+# Unusable extracted keywords: truncated fragments that start with an
+# ellipsis ("... groups for adults") or strings too short to be a real
+# keyword (< 3 chars). One compiled check instead of the three Python-level
+# tests both extraction passes used to repeat per match.
+_BAD_KW_RE = re.compile(r'^(?:\.{3}|…|.{0,2}$)')
+
 _GROWTH_RE = re.compile(
     r'[\u201c"]'              # opening quote
     r'\s*([^"\u201d]{3,60}?)' # keyword (3-60 chars)
@@ -147,10 +157,7 @@ def _extract_from_text(text: str, category: str,
     for m in _GROWTH_RE.finditer(text):
         kw = m.group(1).strip()
         kw_lower = kw.lower()
-        if kw_lower in seen or len(kw) < 3:
-            continue
-        # Skip partial patterns like "... groups for adults"
-        if kw.startswith("...") or kw.startswith("\u2026"):
+        if kw_lower in seen or _BAD_KW_RE.match(kw):
             continue
         growth = _parse_growth(m.group(2))
         seen.add(kw_lower)
@@ -165,9 +172,7 @@ def _extract_from_text(text: str, category: str,
     for m in _QUOTE_RE.finditer(text):
         kw = m.group(1).strip()
         kw_lower = kw.lower()
-        if kw_lower in seen or len(kw) < 3:
-            continue
-        if kw.startswith("...") or kw.startswith("\u2026"):
+        if kw_lower in seen or _BAD_KW_RE.match(kw):
             continue
         # Skip filler phrases
         if kw_lower in ("as an adult", "as an introvert", "as a teenager"):
@@ -216,9 +221,12 @@ def fetch_email(mark_read: bool = False) -> list[dict]:
         return []
 
     try:
-        mail = imaplib.IMAP4_SSL("imap.gmail.com")
+        # Socket-level timeout: without it a hung Gmail connection keeps the
+        # worker thread alive past SOURCE_TIMEOUT and the interpreter joins
+        # it at exit — the scheduler would leak a stuck process per run.
+        mail = imaplib.IMAP4_SSL("imap.gmail.com", timeout=_IMAP_TIMEOUT)
         mail.login(addr, pw)
-    except imaplib.IMAP4.error as e:
+    except (imaplib.IMAP4.error, OSError) as e:
         msg = f"[email] IMAP login failed: {e}"
         print(msg)
         # Write to persistent error log so Task Scheduler failures are visible
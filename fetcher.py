@@ -9,7 +9,13 @@ For keywords that survive filtering, we pull a 30-day time series
 via interest_over_time so scorer.py can compute velocity and freshness.
 """
 
+import json
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
 from trendspy import Trends
 
 # Google's Trending Now topic IDs → our category names.
@@ -31,6 +37,70 @@ TOPIC_MAP: dict[int, str] = {
 # daily runs build IP heat so we need the full recommended delay.
 _client = Trends(request_delay=10)
 
+# Seconds between interest_over_time batches — cools down the session.
+_BATCH_DELAY = 15.0
+
+# Disk cache for interest_over_time series. Daily-resolution series don't
+# change within a day, so reruns (manual testing, a second cron attempt)
+# shouldn't re-hit the scraper endpoint. Keyed "keyword|timeframe|geo".
+_CACHE_PATH = Path(__file__).parent / "data" / ".series_cache.json"
+_CACHE_TTL = 86400  # 24 hours
+
+
+def _load_series_cache() -> dict:
+    """Load the series cache, dropping entries past their TTL."""
+    try:
+        with open(_CACHE_PATH) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    cutoff = time.time() - _CACHE_TTL
+    return {k: v for k, v in cache.items() if v.get("ts", 0) > cutoff}
+
+
+def _save_series_cache(cache: dict) -> None:
+    try:
+        _CACHE_PATH.parent.mkdir(exist_ok=True)
+        with open(_CACHE_PATH, "w") as f:
+            json.dump(cache, f)
+    except OSError:
+        pass  # cache is best-effort — never fail the fetch over it
+
+# Two concurrent fetch streams for time-series batches. Google's rate
+# limit is per-IP-per-window, not per-connection, so two streams each
+# honoring the full _BATCH_DELAY stay under it as long as they're offset
+# from each other (see the stagger in fetch_time_series).
+_FETCH_WORKERS = 2
+
+# Per-thread state: each fetch worker owns its own Trends client (trendspy
+# clients share a requests.Session and cookie state, so they can't be used
+# from two threads) and its own cooldown timestamp for _rate_limit_gate.
+_thread_state = threading.local()
+
+
+def _worker_client() -> Trends:
+    """Return this thread's Trends client, creating it on first use."""
+    if not hasattr(_thread_state, "client"):
+        _thread_state.client = Trends(request_delay=10)
+    return _thread_state.client
+
+
+def _rate_limit_gate(min_interval: float = _BATCH_DELAY) -> None:
+    """Sleep only for whatever part of min_interval hasn't already elapsed
+    since this thread's previous batch.
+
+    Called at the top of each batch iteration instead of sleeping a flat
+    15s at the bottom: DataFrame parsing time counts toward the cooldown
+    rather than being added on top of it, and the final batch no longer
+    pays a sleep nothing waits on. No-op on a thread's first call.
+    """
+    last = getattr(_thread_state, "last_batch_ts", None)
+    if last is not None:
+        remaining = min_interval - (time.monotonic() - last)
+        if remaining > 0:
+            time.sleep(remaining)
+    _thread_state.last_batch_ts = time.monotonic()
+
 
 def fetch_trending(geo: str = "US") -> list[dict]:
     """
@@ -65,36 +135,84 @@ def fetch_trending(geo: str = "US") -> list[dict]:
 
 
 def fetch_time_series(keywords: list[str], geo: str = "US",
-                      timeframe: str = "today 1-m") -> dict[str, list[float]]:
+                      timeframe: str = "today 1-m") -> dict[str, np.ndarray]:
     """
     For a list of keywords, fetch interest_over_time series.
-    Returns { keyword: [float, ...] } for each keyword that has data.
+    Returns { keyword: ndarray } for each keyword that has data — the
+    pandas column is handed over as its numpy array instead of being
+    re-boxed into a list of Python floats (the series never reaches the
+    signals JSON; scorer consumes it directly).
 
     Batches into groups of 5 (Google's limit). Sleeps between batches.
     Only called for keywords that survive noise filtering — typically 10-20,
     so 2-4 API calls max.
     """
-    series: dict[str, list[float]] = {}
-
-    chunks = [keywords[i:i + 5] for i in range(0, len(keywords), 5)]
-    for chunk in chunks:
-        for attempt in range(2):  # 1 retry on 429
-            try:
-                df = _client.interest_over_time(chunk, timeframe=timeframe, geo=geo)
-                if df is not None and not df.empty:
-                    df = df.drop(columns=["isPartial"], errors="ignore")
-                    for kw in chunk:
-                        if kw in df.columns:
-                            series[kw] = df[kw].tolist()
-                break  # success — move to next chunk
-            except Exception as e:
-                if "429" in str(e) and attempt == 0:
-                    print(f"[fetcher] 429 on batch, retrying in 30s...")
-                    time.sleep(30)
-                else:
-                    print(f"[fetcher] interest_over_time failed for {chunk}: {e}")
-                    break
-
-        time.sleep(15)  # 15s between batches to cool down the session
-
+    series: dict[str, np.ndarray] = {}
+
+    # Serve what we can from the disk cache; only fetch the rest
+    cache = _load_series_cache()
+    missing: list[str] = []
+    for kw in keywords:
+        entry = cache.get(f"{kw}|{timeframe}|{geo}")
+        if entry:
+            series[kw] = np.asarray(entry["series"], dtype=np.float32)
+        else:
+            missing.append(kw)
+
+    if len(series):
+        print(f"[fetcher] {len(series)}/{len(keywords)} series from cache")
+    if not missing:
+        return series
+
+    chunks = [missing[i:i + 5] for i in range(0, len(missing), 5)]
+
+    # Two worker streams, started half a cooldown apart so their requests
+    # interleave instead of colliding. Each worker paces itself with the
+    # per-thread _rate_limit_gate, so the per-session 15s spacing holds.
+    with ThreadPoolExecutor(max_workers=_FETCH_WORKERS) as ex:
+        futures = []
+        for i, chunk in enumerate(chunks):
+            if i == 1:
+                time.sleep(_BATCH_DELAY / 2)  # offset the second stream
+            futures.append(ex.submit(_fetch_chunk, chunk, timeframe, geo))
+
+        for future in futures:
+            for kw, values in future.result().items():
+                series[kw] = values
+                cache[f"{kw}|{timeframe}|{geo}"] = {
+                    "ts": time.time(), "series": values.tolist(),
+                }
+
+    _save_series_cache(cache)
     return series
+
+
+def _fetch_chunk(chunk: list[str], timeframe: str,
+                 geo: str) -> dict[str, np.ndarray]:
+    """Fetch interest_over_time for one batch of up to 5 keywords.
+
+    Runs on a fetch worker thread — uses the thread's own client and
+    rate gate. Returns {keyword: series} for keywords that had data.
+    """
+    out: dict[str, np.ndarray] = {}
+    client = _worker_client()
+    _rate_limit_gate()  # 15s between this thread's batches
+    for attempt in range(2):  # 1 retry on 429
+        try:
+            df = client.interest_over_time(chunk, timeframe=timeframe, geo=geo)
+            if df is not None and not df.empty:
+                # Select keyword columns directly — no need to copy the
+                # whole frame just to drop isPartial first. float32 is
+                # plenty for 0-100 interest values and halves the array.
+                for kw in chunk:
+                    if kw in df.columns:
+                        out[kw] = df[kw].to_numpy(dtype=np.float32)
+            break  # success
+        except Exception as e:
+            if "429" in str(e) and attempt == 0:
+                print(f"[fetcher] 429 on batch, retrying in 30s...")
+                time.sleep(30)
+            else:
+                print(f"[fetcher] interest_over_time failed for {chunk}: {e}")
+                break
+    return out
@@ -18,22 +18,48 @@ Usage:
 """
 
 import argparse
+import atexit
+import heapq
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
 from datetime import date
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # unpinned dev env — stdlib json still works
+    orjson = None
+
 from fetcher import fetch_trending, fetch_time_series
 from rss_fetcher import fetch_rss
-from email_ingest import fetch_email
-from scorer import is_buildable, score_trend
+from scorer import is_buildable, score_trend, score_trends_batch
 from cluster import detect_clusters, get_unclustered, rescore_clusters
-from reddit_check import validate_clusters
-from competitor_check import validate_build_opportunities
-from reporter import write_briefing, _push_briefing_to_v2
 from trend_memory import annotate as annotate_memory
 
+# email_ingest (BeautifulSoup), reddit_check/competitor_check (LLM + search
+# plumbing) and reporter (openai) are imported lazily at their stage — a
+# --no-email/--no-reddit/--no-competitor run shouldn't pay their import
+# cost, which dominates interpreter startup.
+
 DATA_DIR = Path(__file__).parent / "data"
 
+# Per-source timeout for concurrent collection. Generous — a normal source
+# finishes in well under a minute; this only exists so one hung connection
+# can't stall the whole morning run.
+SOURCE_TIMEOUT = 90
+
+# One long-lived executor for source fetches — constructing a fresh pool
+# (and its worker threads) per _collect call is wasted churn. Note that
+# wait=False only skips the join in our atexit hook: the interpreter still
+# joins the non-daemon workers at shutdown, so a truly hung source call
+# WOULD hang the process at exit. That's why every source must bound its
+# own I/O at the socket level (e.g. the IMAP timeout in email_ingest) —
+# SOURCE_TIMEOUT alone only unblocks the pipeline stages, not exit.
+_EXECUTOR = ThreadPoolExecutor(max_workers=3)
+atexit.register(_EXECUTOR.shutdown, wait=False)
+
 
 def _normalize_rss(rss_trends: list[dict]) -> list[dict]:
     """Convert RSS items into the same shape trendspy returns so they
@@ -80,32 +106,46 @@ def _normalize_email(email_trends: list[dict]) -> list[dict]:
     return normalized
 
 
-def _collect(sources: list[str]) -> list[dict]:
-    """Fetch from requested sources and return a unified list."""
-    all_trends: list[dict] = []
-
-    if "trendspy" in sources:
-        print("[pipeline] Fetching from trendspy...")
+def _fetch_source(source: str) -> list[dict]:
+    """Fetch one source and normalize it to the scorer's expected shape."""
+    if source == "trendspy":
         ts = fetch_trending()
         # Tag source for cross-reference (issue #5)
         for t in ts:
             t.setdefault("source", "trendspy")
-        print(f"[pipeline]   trendspy: {len(ts)} trends in tracked categories")
-        all_trends.extend(ts)
-
-    if "rss" in sources:
-        print("[pipeline] Fetching from RSS...")
-        rss = fetch_rss()
-        rss_norm = _normalize_rss(rss)
-        print(f"[pipeline]   rss: {len(rss_norm)} trends")
-        all_trends.extend(rss_norm)
-
-    if "email" in sources:
-        print("[pipeline] Fetching from email...")
-        email_trends = fetch_email(mark_read=False)
-        email_norm = _normalize_email(email_trends)
-        print(f"[pipeline]   email: {len(email_norm)} trends")
-        all_trends.extend(email_norm)
+        return ts
+    if source == "rss":
+        return _normalize_rss(fetch_rss())
+    if source == "email":
+        from email_ingest import fetch_email
+        return _normalize_email(fetch_email(mark_read=False))
+    return []
+
+
+def _collect(sources: list[str]) -> list[dict]:
+    """Fetch from requested sources and return a unified list.
+
+    The three sources are independent network calls (trendspy HTTP, RSS
+    fetch, Gmail IMAP), so they run concurrently — wall time is the slowest
+    source instead of the sum. Results are collected in source order so
+    the merged list (and everything downstream) stays deterministic.
+    """
+    all_trends: list[dict] = []
+
+    print(f"[pipeline] Fetching {len(sources)} source(s) concurrently...")
+    futures = {s: _EXECUTOR.submit(_fetch_source, s) for s in sources}
+    for source in sources:
+        try:
+            trends = futures[source].result(timeout=SOURCE_TIMEOUT)
+        except FutureTimeout:
+            print(f"[pipeline]   {source}: timed out after "
+                  f"{SOURCE_TIMEOUT}s -- skipping")
+            continue
+        except Exception as e:  # noqa: BLE001 — one bad source can't kill the run
+            print(f"[pipeline]   {source}: failed ({e}) -- skipping")
+            continue
+        print(f"[pipeline]   {source}: {len(trends)} trends")
+        all_trends.extend(trends)
 
     return all_trends
 
@@ -155,10 +195,20 @@ def _cross_reference(trends: list[dict]) -> list[dict]:
                     g["category"] = t["category"]
                 g["source"] = source
                 g["_src_rank"] = rank
-            # Merge related news
-            g["related_news"].extend(t.get("related_news", []))
-            # Merge trend keywords
-            g["trend_keywords"].extend(t.get("trend_keywords", []))
+            # Merge related news / trend keywords, deduplicating as we go —
+            # the same article or keyword can arrive from several sources
+            # (or twice from one on a same-day rerun) and duplicates would
+            # otherwise accumulate into the signals file unbounded.
+            seen_urls = {n.get("url") for n in g["related_news"]}
+            for n in t.get("related_news", []):
+                if n.get("url") not in seen_urls:
+                    seen_urls.add(n.get("url"))
+                    g["related_news"].append(n)
+            seen_kws = set(g["trend_keywords"])
+            for k in t.get("trend_keywords", []):
+                if k not in seen_kws:
+                    seen_kws.add(k)
+                    g["trend_keywords"].append(k)
 
     # Clean up internal field
     for g in groups.values():
@@ -167,6 +217,36 @@ def _cross_reference(trends: list[dict]) -> list[dict]:
     return list(groups.values())
 
 
+def _strip_internal(t: dict) -> dict:
+    """Copy a scored record without the raw-trend back-reference.
+
+    "_raw" (the sub-score breakdown) is part of the signals format and
+    stays; only the Stage 3 "_trend" ref is pipeline-internal.
+    """
+    return {k: v for k, v in t.items() if k != "_trend"}
+
+
+def _dump_json(obj: dict, path: Path) -> None:
+    """Write pretty-printed JSON to path atomically.
+
+    Uses orjson when available — the stdlib encoder's indent path is pure
+    Python and the merged signals file runs to hundreds of KB, so this
+    shaves a visible chunk off the end-of-pipeline latency.
+
+    The dump goes to a sibling temp file that is renamed into place, so
+    nothing reading the signals file mid-run (trend_memory on tomorrow's
+    run, a manual inspection, the decisions rewrite racing a crash) can
+    ever observe a truncated JSON document.
+    """
+    tmp = path.with_suffix(".json.tmp")
+    if orjson is not None:
+        tmp.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        with open(tmp, "w") as f:
+            json.dump(obj, f, indent=2)
+    os.replace(tmp, path)
+
+
 def _persist_decisions(output: dict, out_path: Path) -> None:
     """Re-write signals JSON with decision data attached during briefing.
 
@@ -189,8 +269,7 @@ def _persist_decisions(output: dict, out_path: Path) -> None:
 
     if decisions:
         output["decisions"] = decisions
-        with open(out_path, "w") as f:
-            json.dump(output, f, indent=2)
+        _dump_json(output, out_path)
         print(f"[pipeline] Decisions persisted ({len(decisions)} entries)")
 
 
@@ -226,7 +305,12 @@ def run(sources: list[str], top_n: int = 15,
         return None
 
     # --- Stage 3: Score ALL filtered trends (not just top N) ---
-    scored = [score_trend(t) for t in filtered]
+    # Each scored record carries a reference to its raw trend ("_trend")
+    # so the Stage 6 re-score never has to look the raw data back up.
+    # Stripped before serialization in Stage 7.
+    scored = score_trends_batch(filtered)
+    for s, t in zip(scored, filtered):
+        s["_trend"] = t
 
     # Apply multi-source confidence boost
     if multi_source:
@@ -247,12 +331,14 @@ def run(sources: list[str], top_n: int = 15,
 
     # --- Stage 5: Reddit validation on top clusters ---
     if not skip_reddit and clusters:
+        from reddit_check import validate_clusters
         print("[pipeline] Validating top clusters against Reddit...")
         validate_clusters(clusters, max_checks=3)
 
     # --- Stage 5.5: Competitor check ---
     competition = {}
     if not skip_competitor and clusters:
+        from competitor_check import validate_build_opportunities
         print("[pipeline] Running competitor checks...")
         competition = validate_build_opportunities(
             clusters, unclustered, max_checks=5
@@ -273,25 +359,24 @@ def run(sources: list[str], top_n: int = 15,
         series_map = fetch_time_series(enrich_keywords)
         print(f"[pipeline] Got series for {len(series_map)}/{len(enrich_keywords)} keywords")
 
-        # Re-score enriched keywords with freshness data
+        # Re-score enriched keywords with freshness data, using the raw
+        # trend each scored record already carries from Stage 3.
         for c in clusters:
             for i, m in enumerate(c["members"]):
                 series = series_map.get(m["keyword"])
-                if series:
-                    raw_trend = next(
-                        (r for r in filtered if r["keyword"] == m["keyword"]), None
-                    )
-                    if raw_trend:
-                        c["members"][i] = score_trend(raw_trend, series=series)
+                raw_trend = m.get("_trend")
+                if series is not None and raw_trend:
+                    rescored = score_trend(raw_trend, series=series)
+                    rescored["_trend"] = raw_trend
+                    c["members"][i] = rescored
 
         for i, t in enumerate(unclustered):
             series = series_map.get(t["keyword"])
-            if series:
-                raw_trend = next(
-                    (r for r in filtered if r["keyword"] == t["keyword"]), None
-                )
-                if raw_trend:
-                    unclustered[i] = score_trend(raw_trend, series=series)
+            raw_trend = t.get("_trend")
+            if series is not None and raw_trend:
+                rescored = score_trend(raw_trend, series=series)
+                rescored["_trend"] = raw_trend
+                unclustered[i] = rescored
 
         # Re-sort clusters after enrichment so top_keyword and cluster_score
         # reflect the updated member scores. Delegates to cluster.py so the
@@ -318,7 +403,7 @@ def run(sources: list[str], top_n: int = 15,
             "member_count":   c["member_count"],
             "top_keyword":    c["top_keyword"],
             "growth_signals": c["growth_signals"],
-            "members":        c["members"],
+            "members":        [_strip_internal(m) for m in c["members"]],
         }
         # Include Reddit validation if present
         if "reddit" in c:
@@ -335,24 +420,27 @@ def run(sources: list[str], top_n: int = 15,
             }
         output["clusters"].append(cluster_out)
 
-    # Top unclustered (individual signals)
-    unclustered.sort(key=lambda t: t["score"], reverse=True)
-    output["unclustered"] = unclustered[:top_n]
+    # Top unclustered (individual signals) — nlargest selects the top N
+    # in O(N log top_n) instead of fully sorting a list we then discard
+    top_unclustered = heapq.nlargest(top_n, unclustered,
+                                     key=lambda t: t["score"])
+    output["unclustered"] = [_strip_internal(t) for t in top_unclustered]
 
     # Annotate with multi-day trend memory (no-op if no history exists yet)
     annotate_memory(output, DATA_DIR)
 
-    with open(out_path, "w") as f:
-        json.dump(output, f, indent=2)
+    _dump_json(output, out_path)
 
     total = sum(c["member_count"] for c in clusters) + len(output["unclustered"])
     print(f"[pipeline] {len(clusters)} clusters + {len(output['unclustered'])} "
           f"unclustered written -> {out_path}")
-    _print_summary(clusters, output["unclustered"])
+    _print_summary(clusters, output["unclustered"], today)
 
     # --- Stage 8: Generate briefing ---
     # Wrap so a briefing bug never loses a successful data run
     try:
+        from reporter import write_briefing, _push_briefing_to_v2
+
         briefing_path = write_briefing(output, today, competition=competition)
         print(f"[pipeline] Briefing written -> {briefing_path}")
 
@@ -368,10 +456,9 @@ def run(sources: list[str], top_n: int = 15,
     return out_path
 
 
-def _print_summary(clusters: list[dict], unclustered: list[dict]) -> None:
+def _print_summary(clusters: list[dict], unclustered: list[dict],
+                   today: str) -> None:
     """Morning-ready summary: clusters first, then top individual signals."""
-    today = date.today().isoformat()
-
     if clusters:
         print(f"\n  === MACRO TRENDS ({today}) ===\n")
         for i, c in enumerate(clusters, 1):
@@ -386,7 +473,7 @@ def _print_summary(clusters: list[dict], unclustered: list[dict]) -> None:
             print(f"  {i}. [{c['cluster_score']}] {c['cluster_name'].upper()}"
                   f"  ({c['member_count']} keywords){reddit_tag}")
 
-            for m in sorted(c["members"], key=lambda m: m["score"], reverse=True)[:5]:
+            for m in heapq.nlargest(5, c["members"], key=lambda m: m["score"]):
                 gpct = m.get("_raw", {}).get("google_growth_pct", 0)
                 if gpct >= 5000:
                     growth = "breakout"
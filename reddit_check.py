@@ -12,11 +12,11 @@ We check top clusters (up to 3 subreddits × 2 queries each, 3 clusters max).
 import json
 import os
 import time
-import urllib.request
-import urllib.error
 from collections import Counter
 from pathlib import Path
+from urllib.parse import quote
 
+import requests
 from dotenv import load_dotenv
 
 from cluster import _stem
@@ -28,6 +28,11 @@ _HEADERS = {
     "User-Agent": "TrendDetector/1.0 (private pipeline; contact: modryn-studio)",
 }
 
+# One session for all Reddit searches — a validation run makes ~15 sequential
+# HTTPS calls to the same host, so keep-alive saves a TLS handshake per call.
+_SESSION = requests.Session()
+_SESSION.headers.update(_HEADERS)
+
 # Minimum seconds between Reddit requests
 _REQUEST_DELAY = 2.0
 
@@ -185,18 +190,18 @@ def _search_subreddit(subreddit: str, query: str,
                       limit: int = 15,
                       time_filter: str = "month") -> list[dict]:
     """Search a specific subreddit. Returns list of post dicts."""
-    encoded_q = urllib.request.quote(query, safe='')
+    encoded_q = quote(query, safe='')
     url = (
         f"https://www.reddit.com/r/{subreddit}/search.json"
         f"?q={encoded_q}&restrict_sr=1&sort=relevance"
         f"&t={time_filter}&limit={limit}"
     )
-    req = urllib.request.Request(url, headers=_HEADERS)
 
     try:
-        with urllib.request.urlopen(req, timeout=15) as resp:
-            data = json.loads(resp.read().decode("utf-8"))
-    except (urllib.error.HTTPError, urllib.error.URLError, TimeoutError):
+        resp = _SESSION.get(url, timeout=15)
+        resp.raise_for_status()
+        data = resp.json()
+    except (requests.RequestException, json.JSONDecodeError):
         return []
 
     posts_raw = data.get("data", {}).get("children", [])